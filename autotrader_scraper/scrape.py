@@ -1,32 +1,166 @@
-import csv
-import json
+import asyncio
+import functools
 import logging
-import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import List, Optional
+from urllib.parse import urlencode
 
-import bs4
-import requests
+import httpx
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from selectolax.parser import HTMLParser
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is unavailable on some platforms
+    np = None
+    njit = None
 
 logging.basicConfig(level=logging.INFO)
 
 URL_BASE = "https://www.autotrader.ca"
+SEARCH_URL_BASE = f"{URL_BASE}/cars/?"
 HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.169 Safari/537.36"
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.169 Safari/537.36",
+    # HTML compresses extremely well, so always ask for it compressed
+    "Accept-Encoding": "gzip, br",
 }
+MAX_CONCURRENT_REQUESTS = 20
+
+# Transient-failure policy: retry up to MAX_RETRIES times with exponential
+# backoff (0.3s, 0.6s, 1.2s) on network errors and on the statuses below
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Byte markers locating the two script payloads in the raw HTML
+_JSON_LD_MARKER = b'"application/ld+json"'
+_NG_VDP_MARKER = b"window['ngVdpModel'] = "
+
+
+@dataclass(slots=True)
+class CarRow:
+    """
+    A single car listing, holding every field we scrape for one CSV row.
 
-def search_autotrader(
+    `extract_car_data` fills the JSON-LD fields and `extract_extra_car_data` fills the
+    ngVdpModel fields. Slots avoid a per-instance dict of ~30 interned string keys, so
+    a row costs a fraction of the equivalent dictionary.
+    """
+    url: Optional[str] = None
+    name: Optional[str] = None
+    make: Optional[str] = None
+    model: Optional[str] = None
+    year: Optional[str] = None
+    color: Optional[str] = None
+    mileage: Optional[int] = None
+    mileage_unit: Optional[str] = None
+    price: Optional[float] = None
+    price_currency: Optional[str] = None
+    availability: Optional[str] = None
+    engine_type: Optional[str] = None
+    fuel_type: Optional[str] = None
+    transmission: Optional[str] = None
+    vehicle_configuration: Optional[str] = None
+    highlight_items: Optional[list] = None
+    feature_highlights: Optional[list] = None
+    feature_options: Optional[list] = None
+    trim: Optional[str] = None
+    location: Optional[str] = None
+    vehicle_age: Optional[str] = None
+    stock_number: Optional[str] = None
+    dealer_name: Optional[str] = None
+    mileage_analysis: Optional[str] = None
+    fuel_economy_city: Optional[float] = None
+    fuel_economy_highway: Optional[float] = None
+    fuel_economy_combined: Optional[float] = None
+    fuel_cost_cents_per_litre: Optional[float] = None
+    specs: Optional[list] = None
+    description: Optional[list] = None
+    price_analysis: Optional[str] = None
+    price_analysis_market_price: Optional[str] = None
+    price_analysis_evaluation: Optional[str] = None
+
+
+# Arrow schema for the Parquet output. Numeric columns keep real dtypes, and
+# low-cardinality strings (the same make/model/dealer repeated across rows)
+# are dictionary-encoded, which shrinks the files dramatically. Nested lists
+# are stored as JSON text.
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+SCHEMA = pa.schema(
+    [
+        ("url", pa.string()),
+        ("name", pa.string()),
+        ("make", _DICT_STRING),
+        ("model", _DICT_STRING),
+        ("year", _DICT_STRING),
+        ("color", _DICT_STRING),
+        ("mileage", pa.int64()),
+        ("mileage_unit", _DICT_STRING),
+        ("price", pa.float64()),
+        ("price_currency", _DICT_STRING),
+        ("availability", _DICT_STRING),
+        ("engine_type", _DICT_STRING),
+        ("fuel_type", _DICT_STRING),
+        ("transmission", _DICT_STRING),
+        ("vehicle_configuration", pa.string()),
+        ("highlight_items", pa.string()),
+        ("feature_highlights", pa.string()),
+        ("feature_options", pa.string()),
+        ("trim", _DICT_STRING),
+        ("location", _DICT_STRING),
+        ("vehicle_age", pa.string()),
+        ("stock_number", pa.string()),
+        ("dealer_name", _DICT_STRING),
+        ("mileage_analysis", _DICT_STRING),
+        ("fuel_economy_city", pa.float64()),
+        ("fuel_economy_highway", pa.float64()),
+        ("fuel_economy_combined", pa.float64()),
+        ("fuel_cost_cents_per_litre", pa.float64()),
+        ("specs", pa.string()),
+        ("description", pa.string()),
+        ("price_analysis", pa.string()),
+        ("price_analysis_market_price", pa.string()),
+        ("price_analysis_evaluation", _DICT_STRING),
+    ]
+)
+
+# Columns needing conversion before they fit the Arrow schema; everything not
+# listed below is string-typed and gets str()-coerced, since the JSON payloads
+# sometimes carry numbers where the site usually shows text (stock numbers,
+# market prices, model years)
+_LIST_COLUMNS = ("highlight_items", "feature_highlights", "feature_options", "specs", "description")
+_INT_COLUMNS = ("mileage",)
+_FLOAT_COLUMNS = ("price", "fuel_economy_city", "fuel_economy_highway", "fuel_economy_combined", "fuel_cost_cents_per_litre")
+_STRING_COLUMNS = tuple(
+    field.name
+    for field in SCHEMA
+    if field.name not in _LIST_COLUMNS + _INT_COLUMNS + _FLOAT_COLUMNS
+)
+
+# How many rows to buffer before writing a chunk to the Parquet file
+WRITE_BATCH_SIZE = 50
+
+async def search_autotrader(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
     make: str, model: str, postal_code: str, radius_km: int = 100, display_results: int = 15,
-) -> bs4.BeautifulSoup:
+) -> HTMLParser:
     """
     Searches AutoTrader for cars based on specified parameters.
 
     This function constructs a URL based on the provided car make, model, 
     postal code, search radius, and number of results to display. It then 
-    sends a GET request to AutoTrader and returns the parsed HTML content 
-    as a BeautifulSoup object.
+    sends a GET request to AutoTrader over the shared client and returns 
+    the parsed HTML content as a selectolax HTML tree.
 
     Args:
+        client (httpx.AsyncClient): The shared client to send the request through.
+        semaphore (asyncio.Semaphore): Semaphore limiting the number of concurrent requests.
         make (str): The make of the car (e.g., 'Toyota').
         model (str): The model of the car (e.g., 'Camry').
         postal_code (str): The postal code to search within (e.g., '90210').
@@ -34,222 +168,499 @@ def search_autotrader(
         display_results (int, optional): The number of results to display. Defaults to 15. Valid values are 15, 25, 50, 100.
 
     Returns:
-        bs4.BeautifulSoup: Parsed HTML content of the search results page.
+        HTMLParser: Parsed HTML content of the search results page.
     """
 
-    url = (
-        URL_BASE
-        + "/cars/?"
-        + "&".join(
-            [f"loc={postal_code}", f"make={make}", f"mdl={model}", f"prx={radius_km}", f"rcp={display_results}"]
-        ).replace(" ", "%20")
+    url = SEARCH_URL_BASE + urlencode(
+        {"loc": postal_code, "make": make, "mdl": model, "prx": radius_km, "rcp": display_results}
     )
-    logging.info(f"Requesting the search page: {url}")
 
-    r = requests.get(url, timeout=15, headers=HEADERS)
-    return bs4.BeautifulSoup(r.content, "html.parser")
+    return HTMLParser(await fetch(client, url, semaphore))
 
 
-def get_car_page_urls(search_page: bs4.BeautifulSoup) -> List[str]:
+def get_car_page_urls(search_page: HTMLParser) -> List[str]:
     """
     Extracts and returns a list of unique car page URLs from a given search page.
 
-    This function scans the provided BeautifulSoup object (`search_page`) for all anchor (`<a>`) tags with specific class attributes, 
+    This function scans the provided HTML tree (`search_page`) for all anchor (`<a>`) tags with specific class attributes, 
     then extracts their `href` attributes to form full URLs. It ensures that the returned list contains only unique URLs.
 
     Args:
-        search_page (bs4.BeautifulSoup): A BeautifulSoup object representing the HTML content of the search page.
+        search_page (HTMLParser): A selectolax tree representing the HTML content of the search page.
 
     Returns:
         List[str]: A list of unique car page URLs as strings.
     """
-    tags = search_page.find_all("a", attrs={"class": ["detail-price-area", "inner-link"]})
+    return list({
+        URL_BASE + tag.attributes["href"]
+        for tag in search_page.css("a.detail-price-area, a.inner-link")
+        if tag.attributes.get("href")
+    })
+
+
+def _with_retries(fetch_func):
+    """
+    Wraps a fetch coroutine so transient failures are retried with backoff.
+
+    A single hiccup no longer aborts a whole make/model run: connection errors,
+    timeouts, and retryable statuses (429 and 5xx) are re-attempted up to
+    MAX_RETRIES times, sleeping RETRY_BACKOFF_FACTOR * 2**attempt between tries.
+    The last failure is re-raised unchanged.
+
+    Args:
+        fetch_func: A coroutine function taking `(client, url, semaphore)`.
+
+    Returns:
+        The wrapped coroutine function.
+    """
+    @functools.wraps(fetch_func)
+    async def wrapper(client, url, semaphore):
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return await fetch_func(client, url, semaphore)
+            except httpx.HTTPError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+
+                delay = RETRY_BACKOFF_FACTOR * 2 ** attempt
+                logging.warning(f"Retrying {url} in {delay:.1f}s after: {e!r}")
+                await asyncio.sleep(delay)
+
+    return wrapper
+
+
+@_with_retries
+async def fetch(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> bytes:
+    """
+    Fetches the raw content of a single URL.
+
+    This function sends an HTTP GET request through the shared client and returns the
+    raw response body. The semaphore caps how many requests are in flight at once so that
+    AutoTrader is not hammered with hundreds of simultaneous streams.
+
+    Args:
+        client (httpx.AsyncClient): The shared client to send the request through.
+        url (str): The URL to fetch.
+        semaphore (asyncio.Semaphore): Semaphore limiting the number of concurrent requests.
+
+    Returns:
+        bytes: The raw response body.
+    """
+    async with semaphore:
+        logging.info(f"Requesting: {url}")
+
+        r = await client.get(url)
+        if r.status_code in RETRY_STATUSES:
+            r.raise_for_status()
+
+        return r.content
+
+
+@_with_retries
+async def fetch_car_page(
+    client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore
+) -> bytes:
+    """
+    Fetches a car page, stopping the download once both script payloads have arrived.
+
+    The two scripts we extract sit well before the end of a car page, so instead of
+    buffering the whole document this function reads the (decompressed) response in
+    chunks and closes the stream as soon as `_extract_scripts` can slice both
+    payloads out of what has been received. The remaining bytes never cross the wire
+    into the buffer.
 
-    car_page_urls = []
-    for _, tag in enumerate(tags):
+    Args:
+        client (httpx.AsyncClient): The shared client to send the request through.
+        url (str): The URL of the car page to fetch.
+        semaphore (asyncio.Semaphore): Semaphore limiting the number of concurrent requests.
 
-        car_url = tag.get("href")
-        car_url = URL_BASE + str(car_url)
-        car_page_urls.append(car_url)
+    Returns:
+        bytes: The raw page content, possibly truncated after both payloads.
+    """
+    async with semaphore:
+        logging.info(f"Requesting: {url}")
+
+        async with client.stream("GET", url) as r:
+            if r.status_code in RETRY_STATUSES:
+                r.raise_for_status()
+
+            body = bytearray()
+            json_ld_count = 0
+            json_ld_scan = 0
+            ng_vdp_seen = False
+            async for chunk in r.aiter_bytes(16384):
+                prev_len = len(body)
+                body.extend(chunk)
+
+                # Resume the cheap marker searches where the previous chunk left
+                # off (rewound a marker length in case one straddles a boundary)
+                while json_ld_count < 2:
+                    hit = body.find(_JSON_LD_MARKER, json_ld_scan)
+                    if hit == -1:
+                        json_ld_scan = max(len(body) - len(_JSON_LD_MARKER) + 1, json_ld_scan)
+                        break
+                    json_ld_count += 1
+                    json_ld_scan = hit + len(_JSON_LD_MARKER)
+
+                if not ng_vdp_seen:
+                    ng_vdp_seen = body.find(b"ngVdpModel", max(prev_len - 10, 0)) != -1
+
+                # Only attempt the full slice once the ngVdpModel assignment and
+                # BOTH JSON-LD scripts have arrived; stopping on the first JSON-LD
+                # alone could lock onto the dealer object when the listing script
+                # sits later in the page. Pages with a single JSON-LD script fall
+                # back to reading the full body.
+                if ng_vdp_seen and json_ld_count >= 2:
+                    json_ld, ng_vdp = _extract_scripts(bytes(body))
+                    if json_ld is not None and ng_vdp is not None:
+                        break
+
+            return bytes(body)
+
+
+def _scan_json_object_end(buf, start: int) -> int:
+    """
+    Brace-depth scan for the end of the JSON object beginning at `start`.
 
-    return list(set(car_page_urls))
+    Braces inside JSON string literals (and escaped quotes inside those strings)
+    are skipped, so a description containing "}" cannot truncate the object.
+    Compiled to a native loop by Numba when it is available; the same function
+    doubles as the interpreted fallback otherwise.
 
+    Args:
+        buf: The bytes (or uint8 array) containing a JSON object.
+        start (int): Index of the object's opening brace.
 
-def get_car_pages(car_page_urls: List[str]) -> List[bs4.BeautifulSoup]:
+    Returns:
+        int: The index one past the closing brace, or -1 if the object never closes.
     """
-    Fetches and returns the HTML content of multiple car pages as BeautifulSoup objects.
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(buf)):
+        c = buf[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == 0x5C:  # backslash
+                escaped = True
+            elif c == 0x22:  # "
+                in_string = False
+        elif c == 0x22:  # "
+            in_string = True
+        elif c == 0x7B:  # {
+            depth += 1
+        elif c == 0x7D:  # }
+            depth -= 1
+            if depth == 0:
+                return i + 1
+
+    return -1
+
+
+if njit is not None:
+    _scan_json_object_end_jit = njit(cache=True)(_scan_json_object_end)
+
+
+def _find_json_object_end(body: bytes, start: int) -> int:
+    """
+    Returns the end index (exclusive) of the JSON object beginning at `start`.
 
-    This function takes a list of car page URLs, sends HTTP GET requests to each URL, and parses the returned HTML content into 
-    BeautifulSoup objects. The function logs each request and collects the parsed HTML in a list.
+    The byte-at-a-time brace scan is the hot inner loop of the extract path, so it
+    runs as a Numba-jitted native loop over a zero-copy uint8 view of the body when
+    Numba is installed, and falls back to the interpreted scan otherwise.
 
     Args:
-        car_page_urls (List[str]): A list of URLs for individual car pages to be fetched.
+        body (bytes): The bytes containing a JSON object.
+        start (int): Index of the object's opening brace.
 
     Returns:
-        List[bs4.BeautifulSoup]: A list of BeautifulSoup objects, each representing the parsed HTML content of a car page.
+        int: The index one past the closing brace, or -1 if the object never closes.
     """
-    car_pages = []
-    for car_page_url in car_page_urls:
-        logging.info(f"Requesting the car page: {car_page_url}")
+    if njit is not None:
+        return int(_scan_json_object_end_jit(np.frombuffer(body, dtype=np.uint8), start))
+
+    return _scan_json_object_end(body, start)
+
 
-        r = requests.get(car_page_url, timeout=15, headers=HEADERS)
-        car_page = bs4.BeautifulSoup(r.content, "html.parser")
-        car_pages.append(car_page)
+def _extract_scripts(car_page: bytes) -> tuple:
+    """
+    Slices a car page's two interesting script payloads straight out of the raw bytes.
 
-    return car_pages
+    Rather than building an HTML tree just to find two `<script>` tags, this function
+    locates the payloads with byte searches: the JSON-LD listing sits after the second
+    `application/ld+json` marker (the first describes the dealer), and the ngVdpModel
+    object is sliced out by scanning to its matching closing brace. Assignments whose
+    spacing differs from the common form are located by stepping from the ngVdpModel
+    name to the first brace after its `=` -- no regex anywhere in the hot path.
 
+    Args:
+        car_page (bytes): The raw HTML content of a car page.
 
-def extract_car_data(car_page: bs4.BeautifulSoup) -> dict:
+    Returns:
+        tuple: A `(json_ld, ng_vdp)` pair of raw JSON payloads as bytes; either element
+        is None if the page has no matching script.
     """
-    Extracts car data from a BeautifulSoup object representing a car page.
+    json_ld = None
+    parts = car_page.split(_JSON_LD_MARKER, 2)
+    if len(parts) > 1:
+        # Prefer the second JSON-LD script (the car listing) when there is one
+        segment = parts[2] if len(parts) > 2 else parts[1]
+        tag_end = segment.find(b">")
+        script_end = segment.find(b"</script", tag_end)
+        if tag_end != -1 and script_end != -1:
+            json_ld = segment[tag_end + 1:script_end].strip()
+
+    ng_vdp = None
+    pos = car_page.find(_NG_VDP_MARKER)
+    if pos != -1:
+        start = pos + len(_NG_VDP_MARKER)
+    else:
+        # Unusual spacing or quoting: step from the name to the first brace
+        # after the assignment's equals sign
+        name_pos = car_page.find(b"ngVdpModel")
+        eq_pos = car_page.find(b"=", name_pos) if name_pos != -1 else -1
+        start = car_page.find(b"{", eq_pos) if eq_pos != -1 else -1
+
+    if start != -1:
+        end = _find_json_object_end(car_page, start)
+        if end != -1:
+            ng_vdp = car_page[start:end]
+
+    return json_ld, ng_vdp
+
+
+def extract_car_data(json_ld: bytes) -> CarRow:
+    """
+    Extracts car data from a car page's JSON-LD script.
 
-    This function parses the car page to find a JSON-LD script containing car information,
-    and extracts relevant details into a dictionary.
+    This function decodes the JSON-LD payload containing the car listing and fills
+    a `CarRow` with the listing's core details (url, name, make, model, year, color,
+    mileage, price, engine, and transmission fields).
 
     Args:
-        car_page (bs4.BeautifulSoup): A BeautifulSoup object representing the HTML content of a car page.
+        json_ld (bytes): The raw contents of the car listing's JSON-LD script.
 
     Returns:
-        dict: A dictionary containing the following car details:
-            - url (str): The URL of the car listing.
-            - name (str): The name of the car.
-            - make (str): The brand/make of the car.
-            - model (str): The model of the car.
-            - year (str): The manufacturing year of the car.
-            - color (str): The color of the car.
-            - mileage (int): The mileage of the car.
-            - mileage_unit (str): The unit of the mileage.
-            - price (float): The price of the car.
-            - price_currency (str): The currency of the price.
-            - availability (str): The availability status of the car.
-            - engine_type (str): The type of engine in the car.
-            - fuel_type (str): The type of fuel used by the car.
-            - transmission (str): The transmission type of the car.
-            - vehicle_configuration (str): The configuration of the vehicle.
-    """
-    json_data = json.loads(
-        car_page.find_all("script", {"type": "application/ld+json"})[1].text
+        CarRow: A row with the JSON-LD fields populated.
+    """
+    json_data = orjson.loads(json_ld)
+    logging.info(f"Extracting data for: {json_data.get("name")}, ({json_data.get("url")})")
+
+    # Bind the nested objects once instead of re-looking them up per field
+    brand = json_data.get("brand") or {}
+    mileage = json_data.get("mileageFromOdometer") or {}
+    offers = json_data.get("offers") or {}
+    engine = json_data.get("vehicleEngine") or {}
+
+    return CarRow(
+        url=json_data.get("url"),
+        name=json_data.get("name"),
+        make=brand.get("name"),
+        model=json_data.get("model"),
+        year=json_data.get("vehicleModelDate"),
+        color=json_data.get("color"),
+        mileage=mileage.get("value"),
+        mileage_unit=mileage.get("unitCode"),
+        price=offers.get("price"),
+        price_currency=offers.get("priceCurrency"),
+        availability=offers.get("availability"),
+        engine_type=engine.get("engineType"),
+        fuel_type=engine.get("fuelType"),
+        transmission=json_data.get("vehicleTransmission"),
+        vehicle_configuration=json_data.get("vehicleConfiguration"),
     )
-    logging.info(f"Extracting data for: {json_data["name"]}, ({json_data["url"]})")
-
-    return {
-        "url": json_data.get("url", None),
-        "name": json_data.get("name", None),
-        "make": json_data["brand"]["name"],
-        "model": json_data.get("model", None),
-        "year": json_data.get("vehicleModelDate", None),
-        "color": json_data.get("color", None),
-        "mileage": json_data.get("mileageFromOdometer", {}).get("value", None),
-        "mileage_unit": json_data.get("mileageFromOdometer", {}).get("unitCode", None),
-        "price": json_data.get("offers", {}).get("price", None),
-        "price_currency": json_data.get("offers", {}).get("priceCurrency", None),
-        "availability": json_data.get("offers", {}).get("availability", None),
-        "engine_type": json_data.get("vehicleEngine", {}).get("engineType", None),
-        "fuel_type": json_data.get("vehicleEngine", {}).get("fuelType", None),
-        "transmission": json_data.get("vehicleTransmission", None),
-        "vehicle_configuration": json_data.get("vehicleConfiguration", None),
-    }
-
-
-def extract_extra_car_data(car_page: bs4.BeautifulSoup) -> Optional[dict]:
-    """
-    Extracts additional car data from a BeautifulSoup object representing a car page.
-
-    This function searches the car page for JavaScript containing specific car information,
-    extracts the JSON data, and returns it in a structured dictionary.
+
+
+def extract_extra_car_data(car_row: CarRow, ng_vdp: bytes) -> None:
+    """
+    Extracts additional car data from a car page's ngVdpModel object.
+
+    This function decodes the ngVdpModel JSON payload (already sliced out of the page
+    by `_extract_scripts`) and fills in the row's remaining fields: highlights, trim,
+    location, dealer, fuel economy, specs, description, and price analysis.
+
+    Args:
+        car_row (CarRow): The row to populate, as returned by `extract_car_data`.
+        ng_vdp (bytes): The raw JSON of the `window['ngVdpModel']` object.
+    """
+    json_data = orjson.loads(ng_vdp)
+
+    # Bind the nested objects once instead of re-looking them up per field
+    hero = json_data.get("hero") or {}
+    fuel_economy = json_data.get("fuelEconomy") or {}
+    price_analysis = json_data.get("priceAnalysis") or {}
+
+    car_row.highlight_items = json_data.get("highlights", {}).get("items", [])
+    car_row.feature_highlights = json_data.get("featureHighlights", [])
+    car_row.feature_options = json_data.get("featureHighlights", [])
+    car_row.trim = hero.get("trim")
+    car_row.location = hero.get("location")
+    car_row.vehicle_age = hero.get("vehicleAge")
+    car_row.stock_number = hero.get("stockNumber")
+    car_row.dealer_name = json_data.get("ngIcoModel", {}).get("dealerName")
+    car_row.mileage_analysis = json_data.get("conditionAnalysis", {}).get("odometerCondition")
+    car_row.fuel_economy_city = fuel_economy.get("fuelCity")
+    car_row.fuel_economy_highway = fuel_economy.get("fuelHighway")
+    car_row.fuel_economy_combined = fuel_economy.get("fuelCombined")
+    car_row.fuel_cost_cents_per_litre = fuel_economy.get("fuelCost")
+    car_row.specs = json_data.get("specifications")
+    car_row.description = json_data["description"].get("description")
+    car_row.price_analysis = price_analysis.get("priceAnalysisDescription")
+    car_row.price_analysis_market_price = price_analysis.get("priceAnalysisMarketPrice")
+    car_row.price_analysis_evaluation = price_analysis.get("priceEvaluation")
+
+
+def _row_to_record(car_row: CarRow) -> dict:
+    """
+    Converts a row into a record matching the Arrow schema.
+
+    Nested list fields are serialized to JSON text, and the numeric columns are
+    coerced to their declared dtypes (the JSON-LD payload carries some of them
+    as strings).
 
     Args:
-        car_page (bs4.BeautifulSoup): A BeautifulSoup object representing the HTML content of a car page.
+        car_row (CarRow): A parsed car row.
 
     Returns:
-        dict: A dictionary containing the following extra car details:
-            - highlight_items (list): List of car highlights.
-            - feature_highlights (list): List of feature highlights.
-            - feature_options (list): List of feature options.
-            - trim (str): The trim level of the car.
-            - location (str): The location of the car.
-            - price_analysis (dict): Price analysis of the car.
-            - price_analysis_description (str): Description of the price analysis.
-            - vehicle_age (int): The age of the vehicle.
-            - stock_number (str): The stock number of the car.
-            - dealer_name (str): The name of the dealer.
-            - mileage_analysis (str): Analysis of the car's mileage.
-            - fuel_economy_city (float): Fuel economy in the city (L/100km).
-            - fuel_economy_highway (float): Fuel economy on the highway (L/100km).
-            - fuel_economy_combined (float): Combined fuel economy (L/100km).
-            - fuel_cost_cents_per_litre (float): Fuel cost in cents per litre.
-            - specs (list): List of car specifications.
-            - description (list): Description of the car.
-            - price_analysis_description (str): Price analysis of the car.
-            - price_analysis_market_price (str): Market price of the car.
-            - price_analysis_evaluation (str): Price evaluation of the car.
-    """
-    js_data = car_page.find_all("script", {"type": "text/javascript"})
-    js_data = [jd for jd in js_data if "ngVdpModel" in jd.text][0]
-
-    # Use regex to find the JSON object
-    json_match = re.search(r"window\[\'ngVdpModel\'\] = ({.*?});", js_data.contents[0])
-
-    if json_match:
-        json_str = json_match.group(1)
-        json_data = json.loads(json_str)
-
-        return {
-            "highlight_items": json_data.get("highlights", {}).get("items", []),
-            "feature_highlights": json_data.get("featureHighlights", []),
-            "feature_options": json_data.get("featureHighlights", []),
-            "trim": json_data.get("hero", {}).get("trim", None),
-            "location": json_data.get("hero", {}).get("location", None),
-            "vehicle_age": json_data.get("hero", {}).get("vehicleAge", None),
-            "stock_number": json_data.get("hero", {}).get("stockNumber", None),
-            "dealer_name": json_data.get("ngIcoModel", {}).get("dealerName", None),
-            "mileage_analysis": json_data.get("conditionAnalysis", {}).get("odometerCondition", None),
-            "fuel_economy_city": json_data.get("fuelEconomy", {}).get("fuelCity", None),
-            "fuel_economy_highway": json_data.get("fuelEconomy", {}).get("fuelHighway", None),
-            "fuel_economy_combined": json_data.get("fuelEconomy", {}).get("fuelCombined", None),
-            "fuel_cost_cents_per_litre": json_data.get("fuelEconomy", {}).get("fuelCost", None),
-            "specs": json_data.get("specifications", None),
-            "description": json_data["description"].get("description", None),
-            "price_analysis": json_data.get("priceAnalysis", {}).get("priceAnalysisDescription", None),
-            "price_analysis_market_price": json_data.get("priceAnalysis", {}).get("priceAnalysisMarketPrice", None),
-            "price_analysis_evaluation": json_data.get("priceAnalysis", {}).get("priceEvaluation", None),
-        }
-
-    return None
+        dict: The record to hand to `pyarrow.Table.from_pylist`.
+    """
+    record = asdict(car_row)
 
+    for column in _LIST_COLUMNS:
+        if record[column] is not None:
+            record[column] = orjson.dumps(record[column]).decode()
 
-if __name__ == "__main__":
-    postal_code = "B3M 0L8"
-    radius_km = 100
-    display_results = 100
+    for column in _INT_COLUMNS:
+        if record[column] is not None:
+            try:
+                record[column] = int(record[column])
+            except (TypeError, ValueError):
+                logging.warning(f"Could not coerce {column}={record[column]!r} for {record['url']}")
+                record[column] = None
 
-    cars = [("Mazda", "CX-5"), ("Toyota", "RAV4"), ("Honda", "CR-V")]
+    for column in _FLOAT_COLUMNS:
+        if record[column] is not None:
+            try:
+                record[column] = float(record[column])
+            except (TypeError, ValueError):
+                logging.warning(f"Could not coerce {column}={record[column]!r} for {record['url']}")
+                record[column] = None
+
+    for column in _STRING_COLUMNS:
+        if record[column] is not None:
+            record[column] = str(record[column])
+
+    return record
+
+
+def parse_one(car_page: bytes) -> CarRow:
+    """
+    Parses a single car page into one fully populated row.
+
+    This function combines the output of `extract_car_data` and `extract_extra_car_data`
+    for one raw page body. It is the unit of work handed to the process pool: it takes
+    bytes and returns a slotted `CarRow`, both of which pickle cheaply across the
+    process boundary.
+
+    Args:
+        car_page (bytes): The raw HTML content of a car page.
+
+    Returns:
+        CarRow: The merged car data for the page.
+    """
+    json_ld, ng_vdp = _extract_scripts(car_page)
+
+    car_row = extract_car_data(json_ld) if json_ld else CarRow()
+    if ng_vdp:
+        extract_extra_car_data(car_row, ng_vdp)
+
+    return car_row
+
+
+async def scrape_car(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    executor: ProcessPoolExecutor,
+    make: str, model: str, postal_code: str, radius_km: int = 100, display_results: int = 15,
+) -> None:
+    """
+    Runs the full scrape pipeline for a single make and model.
+
+    This function searches AutoTrader, collects the car page URLs, fetches the pages, parses
+    them on the process pool, and streams the rows to the make/model's Parquet file. Each call
+    is an independent pipeline, so several makes can be scraped concurrently over the shared
+    client.
+
+    Args:
+        client (httpx.AsyncClient): The shared client to send requests through.
+        semaphore (asyncio.Semaphore): Semaphore limiting the number of concurrent requests.
+        executor (ProcessPoolExecutor): The shared process pool for CPU-bound parsing.
+        make (str): The make of the car (e.g., 'Toyota').
+        model (str): The model of the car (e.g., 'Camry').
+        postal_code (str): The postal code to search within (e.g., '90210').
+        radius_km (int, optional): The search radius in kilometers. Defaults to 100.
+        display_results (int, optional): The number of results to display. Defaults to 15. Valid values are 15, 25, 50, 100.
+    """
+    logging.info(f"Searching for {make} {model}")
+    search_page = await search_autotrader(
+        client, semaphore, make, model, postal_code, radius_km, display_results=display_results
+    )
+
+    car_page_urls = get_car_page_urls(search_page)
 
+    if len(car_page_urls) > 0:
+        out_file = f"data/{make.lower()}_{model.lower()}_{datetime.now().strftime("%Y-%m-%d")}.parquet"
+        with pq.ParquetWriter(out_file, SCHEMA) as writer:
+            logging.info(f"Writing data to file: {out_file}")
 
-    for car in cars:
-        make, model = car
-        logging.info(f"Searching for {make} {model}")
-        search_page = search_autotrader(make, model, postal_code, radius_km, display_results=display_results)
+            # Hand each body to the process pool the moment it arrives, so the
+            # CPU-bound parsing overlaps with the still-in-flight requests and
+            # the event loop never blocks on a worker; finished rows stream to
+            # the Parquet file one small batch at a time
+            loop = asyncio.get_running_loop()
+            fetches = [fetch_car_page(client, url, semaphore) for url in car_page_urls]
+            batch = []
+            for next_body in asyncio.as_completed(fetches):
+                body = await next_body
+                car_row = await loop.run_in_executor(executor, parse_one, body)
 
-        car_page_urls = get_car_page_urls(search_page)
-        car_pages = get_car_pages(car_page_urls)
+                batch.append(_row_to_record(car_row))
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=SCHEMA))
+                    batch = []
 
-        car_data_list = []
-        for car_page in car_pages:
-            car_data = extract_car_data(car_page)
-            extra_car_data = extract_extra_car_data(car_page)
-            if extra_car_data:
-                car_data.update(extra_car_data)
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=SCHEMA))
 
-            car_data_list.append(car_data)
 
+if __name__ == "__main__":
+    postal_code = "B3M 0L8"
+    radius_km = 100
+    display_results = 100
+
+    cars = [("Mazda", "CX-5"), ("Toyota", "RAV4"), ("Honda", "CR-V")]
 
-        if len(car_data_list) > 0:
-            out_file = f"data/{make.lower()}_{model.lower()}_{datetime.now().strftime("%Y-%m-%d")}.csv"
-            with open(out_file, mode="w", newline="") as file:
-                logging.info(f"Writing data to file: {out_file}")
-                writer = csv.DictWriter(file, fieldnames=car_data_list[0].keys())
 
-                writer.writeheader()
-                writer.writerows(car_data_list)
+    async def main() -> None:
+        # One client shared by every make's pipeline. With HTTP/2, all the
+        # concurrent fetches multiplex over a handful of TLS connections to
+        # autotrader.ca instead of one TCP connection per in-flight request.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
+        async with httpx.AsyncClient(http2=True, headers=HEADERS, timeout=15.0, limits=limits) as client:
+            with ProcessPoolExecutor() as executor:
+                await asyncio.gather(
+                    *(
+                        scrape_car(
+                            client, semaphore, executor,
+                            make, model, postal_code, radius_km, display_results=display_results,
+                        )
+                        for make, model in cars
+                    )
+                )
+
+    asyncio.run(main())
 